@@ -21,19 +21,10 @@ export async function GET(request: NextRequest) {
 
   try {
     const feedResult = await fetchAllFeeds()
+    const items = feedResult.items
 
-    // Re-classify severity with the unified classifier (mirrors the threats API route)
-    const items = feedResult.items.map(item => ({
-      ...item,
-      severity: classifySeverity({
-        title: item.title,
-        description: item.description,
-        source: item.source,
-        sourceType: item.sourceType,
-      }),
-    }))
-
-    // Severity distribution
+    // Severity distribution, sector coverage, and freshness (last 6, 24, 72 hours)
+    // aggregated in a single pass over the items
     const severityDist: Record<string, number> = {
       critical: 0,
       high: 0,
@@ -41,25 +32,37 @@ export async function GET(request: NextRequest) {
       low: 0,
       unknown: 0,
     }
-    for (const item of items) {
-      severityDist[item.severity] = (severityDist[item.severity] || 0) + 1
-    }
-
-    // Sector coverage — count items per sector
     const sectorCoverage: Record<string, number> = {}
+    const freshness = { last6h: 0, last24h: 0, last72h: 0 }
+    let energyRelevant = 0
+    const now = Date.now()
+    const HOUR_MS = 60 * 60 * 1000
+
     for (const item of items) {
+      // Re-classify severity with the unified classifier (mirrors the threats API route).
+      // Only the distribution is reported, so items aren't copied just to carry the new value.
+      const severity = classifySeverity({
+        title: item.title,
+        description: item.description,
+        source: item.source,
+        sourceType: item.sourceType,
+      })
+      severityDist[severity] = (severityDist[severity] || 0) + 1
+      if (item.isEnergyRelevant) energyRelevant++
+
       const sectors = item.sectors || classifyThreatBySector(item.title, item.description)
       for (const sector of sectors) {
         sectorCoverage[sector] = (sectorCoverage[sector] || 0) + 1
       }
-    }
 
-    // Freshness — count items from last 6, 24, and 72 hours
-    const now = Date.now()
-    const freshness = {
-      last6h: items.filter(i => now - new Date(i.pubDate).getTime() < 6 * 60 * 60 * 1000).length,
-      last24h: items.filter(i => now - new Date(i.pubDate).getTime() < 24 * 60 * 60 * 1000).length,
-      last72h: items.filter(i => now - new Date(i.pubDate).getTime() < 72 * 60 * 60 * 1000).length,
+      const ageMs = now - new Date(item.pubDate).getTime()
+      if (ageMs < 72 * HOUR_MS) {
+        freshness.last72h++
+        if (ageMs < 24 * HOUR_MS) {
+          freshness.last24h++
+          if (ageMs < 6 * HOUR_MS) freshness.last6h++
+        }
+      }
     }
 
     const durationMs = Date.now() - startTime
@@ -69,7 +72,7 @@ export async function GET(request: NextRequest) {
       timestamp: new Date().toISOString(),
       durationMs,
       totalItems: items.length,
-      energyRelevant: items.filter(i => i.isEnergyRelevant).length,
+      energyRelevant,
       deduplicatedCount: feedResult.deduplicatedCount,
       sourcesOnline: feedResult.sourcesOnline,
       sourcesTotal: feedResult.sourcesTotal,
@@ -79,7 +82,7 @@ export async function GET(request: NextRequest) {
       errors: feedResult.errors,
     }
 
-    console.log('[CAPRI Cron] Feed refresh complete:', JSON.stringify(summary, null, 2))
+    console.log('[CAPRI Cron] Feed refresh complete:', JSON.stringify(summary))
 
     return NextResponse.json(summary)
   } catch (error) {
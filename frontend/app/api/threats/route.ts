@@ -15,9 +15,17 @@ import { buildVendorAlerts } from '@/lib/supply-chain'
 export const revalidate = 0 // No caching - always fetch fresh data
 
 // In-memory cache with 1-minute TTL
-let cachedResponse: { data: any; timestamp: number } | null = null
+// The bulky part of the response is stored pre-serialized (everything but `meta`, minus the
+// closing brace) so cache hits only stringify the small meta object with the current cacheAge
+let cachedResponse: { body: string; meta: any; timestamp: number } | null = null
 const CACHE_TTL_MS = 60 * 1000 // 1 minute
 
+function jsonResponse(body: string, cacheStatus: 'HIT' | 'MISS'): NextResponse {
+  return new NextResponse(body, {
+    headers: { 'Content-Type': 'application/json', 'X-Cache': cacheStatus },
+  })
+}
+
 // Extract first URL from KEV notes field
 function parseAdvisoryUrl(notes: string): string {
   const urlMatch = notes.match(/https?:\/\/[^\s;]+/)
@@ -41,9 +49,8 @@ export async function GET(request: NextRequest) {
   // Check cache first — skip when user-provided keys are present
   if (!hasUserKeys && cachedResponse && (Date.now() - cachedResponse.timestamp) < CACHE_TTL_MS) {
     const cacheAge = Math.round((Date.now() - cachedResponse.timestamp) / 1000)
-    const response = NextResponse.json({ ...cachedResponse.data, meta: { ...cachedResponse.data.meta, cacheAge } })
-    response.headers.set('X-Cache', 'HIT')
-    return response
+    const meta = JSON.stringify({ ...cachedResponse.meta, cacheAge })
+    return jsonResponse(`${cachedResponse.body},"meta":${meta}}`, 'HIT')
   }
 
   try {
@@ -70,16 +77,6 @@ export async function GET(request: NextRequest) {
       .filter(item => item.source === 'CISA KEV' && item.id.startsWith('KEV-'))
       .map(item => item.id.replace('KEV-', ''))
     const epssScores = await fetchEPSSScores(kevCveIds)
-    feedResult.items = feedResult.items.map(item => {
-      if (item.source === 'CISA KEV' && item.id.startsWith('KEV-')) {
-        const cveId = item.id.replace('KEV-', '')
-        const epss = epssScores.get(cveId)
-        if (epss) {
-          return { ...item, epssScore: epss.epss, epssPercentile: epss.percentile }
-        }
-      }
-      return item
-    })
 
     // AI Analysis: Analyze energy-relevant items for severity scoring
     const energyItems = feedResult.items.filter(item => item.isEnergyRelevant)
@@ -104,38 +101,43 @@ export async function GET(request: NextRequest) {
       }
     }
 
-    // Merge AI results into threat items
+    // Merge EPSS and AI results, then re-classify severity with all signals available —
+    // one pass and one copy per item instead of three successive map/spread passes
     const aiResultsMap = new Map(aiResults.map(r => [r.id, r]))
     feedResult.items = feedResult.items.map(item => {
+      const merged: ThreatItem = { ...item }
+
+      if (item.source === 'CISA KEV' && item.id.startsWith('KEV-')) {
+        const epss = epssScores.get(item.id.replace('KEV-', ''))
+        if (epss) {
+          merged.epssScore = epss.epss
+          merged.epssPercentile = epss.percentile
+        }
+      }
+
       const aiResult = aiResultsMap.get(item.id)
       if (aiResult) {
-        return {
-          ...item,
-          aiSeverityScore: aiResult.severityScore,
-          aiThreatType: aiResult.threatType,
-          aiUrgency: aiResult.urgency,
-          aiAffectedVendors: aiResult.affectedVendors,
-          aiAffectedSystems: aiResult.affectedSystems,
-          aiAffectedProtocols: aiResult.affectedProtocols,
-          aiRationale: aiResult.rationale,
-        }
+        merged.aiSeverityScore = aiResult.severityScore
+        merged.aiThreatType = aiResult.threatType
+        merged.aiUrgency = aiResult.urgency
+        merged.aiAffectedVendors = aiResult.affectedVendors
+        merged.aiAffectedSystems = aiResult.affectedSystems
+        merged.aiAffectedProtocols = aiResult.affectedProtocols
+        merged.aiRationale = aiResult.rationale
       }
-      return item
-    })
 
-    // Post-AI severity reconciliation: re-classify with all signals available
-    feedResult.items = feedResult.items.map(item => ({
-      ...item,
-      severity: classifySeverity({
-        title: item.title,
-        description: item.description,
-        source: item.source,
-        sourceType: item.sourceType,
-        aiSeverityScore: item.aiSeverityScore,
-        epssScore: item.epssScore,
-        isKEV: item.source === 'CISA KEV',
-      }),
-    }))
+      // Post-AI severity reconciliation
+      merged.severity = classifySeverity({
+        title: merged.title,
+        description: merged.description,
+        source: merged.source,
+        sourceType: merged.sourceType,
+        aiSeverityScore: merged.aiSeverityScore,
+        epssScore: merged.epssScore,
+        isKEV: merged.source === 'CISA KEV',
+      })
+      return merged
+    })
 
     // Detect active campaigns by correlating feed items against actor TTP signatures
     const campaigns = detectCampaigns(feedResult.items, threatActors)
@@ -196,11 +198,15 @@ export async function GET(request: NextRequest) {
       'hydro', 'nuclear', 'gas', 'coal', 'oil',
       'geothermal', 'biomass', 'other',
     ]
+    // Bucket in one pass over the items instead of re-filtering the full list per sector
     const threatsBySector: Record<string, ThreatItem[]> = {}
-    for (const sector of allSectors) {
-      threatsBySector[sector] = feedResult.items
-        .filter(item => item.sectors && item.sectors.includes(sector))
-        .slice(0, 25)
+    for (const sector of allSectors) threatsBySector[sector] = []
+    for (const item of feedResult.items) {
+      if (!item.sectors) continue
+      for (const sector of item.sectors) {
+        const bucket = threatsBySector[sector]
+        if (bucket && bucket.length < 25) bucket.push(item)
+      }
     }
 
     // Build response data
@@ -230,8 +236,7 @@ export async function GET(request: NextRequest) {
         vendorAlertCount: vendorAlerts.filter(v => v.kevCount > 0).length,
         cacheAge: 0,
         enrichmentSources: {
-          configured: getConfiguredEnrichmentCount(hasUserKeys ? userKeys : undefined).configured,
-          total: getConfiguredEnrichmentCount(hasUserKeys ? userKeys : undefined).total,
+          ...getConfiguredEnrichmentCount(hasUserKeys ? userKeys : undefined),
           online: enrichmentResult.sourcesOnline,
         },
         icsExposure: {
@@ -241,14 +246,16 @@ export async function GET(request: NextRequest) {
       }
     }
 
+    // Serialize the payload once; `meta` is appended last so hits can swap in a fresh cacheAge
+    const { meta, ...payload } = responseData
+    const body = JSON.stringify(payload).slice(0, -1)
+
     // Store in cache only when not using user-provided keys
     if (!hasUserKeys) {
-      cachedResponse = { data: responseData, timestamp: Date.now() }
+      cachedResponse = { body, meta, timestamp: Date.now() }
     }
 
-    const response = NextResponse.json(responseData)
-    response.headers.set('X-Cache', 'MISS')
-    return response
+    return jsonResponse(`${body},"meta":${JSON.stringify(meta)}}`, 'MISS')
   } catch (error) {
     console.error('CAPRI-E API Error:', error)
     return NextResponse.json({
@@ -3,6 +3,8 @@
 
 import { NextRequest, NextResponse } from 'next/server'
 
+export const maxDuration = 30 // seconds — a full, paced batch takes ~20s
+
 interface WebhookPayload {
   alertType: 'critical_threat' | 'kev_added' | 'score_change' | 'test'
   title: string
@@ -14,9 +16,15 @@ interface WebhookPayload {
 
 interface RequestBody {
   webhookUrl: string
-  payload: WebhookPayload
+  payload?: WebhookPayload
+  payloads?: WebhookPayload[]  // batch form — delivered in order, one result per payload
 }
 
+// Batch limits: cap outbound POSTs per request, and space them out so a burst of
+// alerts doesn't trip Slack/Discord webhook rate limits (roughly one message per second)
+const MAX_BATCH_PAYLOADS = 20
+const BATCH_DELIVERY_DELAY_MS = 1000
+
 // Alert type configuration for styling
 const ALERT_TYPE_CONFIG: Record<string, { emoji: string; color: string; label: string }> = {
   critical_threat: { emoji: ':rotating_light:', color: '#DC2626', label: 'Critical Threat' },
@@ -25,6 +33,14 @@ const ALERT_TYPE_CONFIG: Record<string, { emoji: string; color: string; label: s
   test: { emoji: ':white_check_mark:', color: '#059669', label: 'Test Message' },
 }
 
+// Detail key formatting ("latestKev" → "Latest Kev"), shared by every payload builder
+const CAMEL_BOUNDARY_RE = /([A-Z])/g
+const FIRST_CHAR_RE = /^./
+
+function formatDetailKey(key: string): string {
+  return key.replace(CAMEL_BOUNDARY_RE, ' $1').replace(FIRST_CHAR_RE, str => str.toUpperCase()).trim()
+}
+
 // Build Slack-compatible webhook payload
 function buildSlackPayload(payload: WebhookPayload): object {
   const config = ALERT_TYPE_CONFIG[payload.alertType] || ALERT_TYPE_CONFIG.test
@@ -33,14 +49,9 @@ function buildSlackPayload(payload: WebhookPayload): object {
   const fields: { type: string; text: string }[] = []
   if (payload.details) {
     Object.entries(payload.details).forEach(([key, value]) => {
-      // Format the key nicely
-      const formattedKey = key
-        .replace(/([A-Z])/g, ' $1')
-        .replace(/^./, str => str.toUpperCase())
-        .trim()
       fields.push({
         type: 'mrkdwn',
-        text: `*${formattedKey}:*\n${value}`,
+        text: `*${formatDetailKey(key)}:*\n${value}`,
       })
     })
   }
@@ -213,11 +224,7 @@ function buildTelegramPayload(payload: WebhookPayload): { text: string; parse_mo
   if (payload.details) {
     text += '\n'
     for (const [key, value] of Object.entries(payload.details)) {
-      const formattedKey = key
-        .replace(/([A-Z])/g, ' $1')
-        .replace(/^./, str => str.toUpperCase())
-        .trim()
-      text += `<b>${escapeHtml(formattedKey)}:</b> ${escapeHtml(String(value))}\n`
+      text += `<b>${escapeHtml(formatDetailKey(key))}:</b> ${escapeHtml(String(value))}\n`
     }
   }
 
@@ -244,7 +251,7 @@ function buildDiscordPayload(payload: WebhookPayload): object {
 
   const fields = payload.details
     ? Object.entries(payload.details).map(([key, value]) => ({
-        name: key.replace(/([A-Z])/g, ' $1').replace(/^./, str => str.toUpperCase()).trim(),
+        name: formatDetailKey(key),
         value: String(value),
         inline: true,
       }))
@@ -268,10 +275,92 @@ function buildDiscordPayload(payload: WebhookPayload): object {
   }
 }
 
+// Outcome of delivering one payload: HTTP status for the single-payload response plus its JSON body
+interface DeliveryResult {
+  status: number
+  body: { success: boolean; message?: string; error?: string; details?: string }
+}
+
+// Format a payload for the target webhook type and send it
+async function deliverWebhook(webhookUrl: string, payload: WebhookPayload): Promise<DeliveryResult> {
+  // Build appropriate payload based on webhook type
+  let webhookPayload: object
+  let targetUrl = webhookUrl
+  let isTelegram = false
+
+  if (isTelegramWebhook(webhookUrl)) {
+    const parsed = parseTelegramUrl(webhookUrl)
+    if (!parsed) {
+      return {
+        status: 400,
+        body: { success: false, error: 'Invalid Telegram URL. Expected format: https://api.telegram.org/bot<TOKEN>/sendMessage?chat_id=<CHAT_ID>' },
+      }
+    }
+    targetUrl = `https://api.telegram.org/bot${parsed.botToken}/sendMessage`
+    const telegramBody = buildTelegramPayload(payload)
+    webhookPayload = { chat_id: parsed.chatId, ...telegramBody }
+    isTelegram = true
+  } else if (isSlackWebhook(webhookUrl)) {
+    webhookPayload = buildSlackPayload(payload)
+  } else if (isDiscordWebhook(webhookUrl)) {
+    webhookPayload = buildDiscordPayload(payload)
+  } else {
+    // Generic webhook - send JSON payload
+    webhookPayload = buildGenericPayload(payload)
+  }
+
+  // Send webhook request
+  const response = await fetch(targetUrl, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify(webhookPayload),
+  })
+
+  // Check response — Telegram uses { ok: true/false } format
+  if (isTelegram) {
+    const responseJson = await response.json().catch(() => ({ ok: false, description: 'Failed to parse response' }))
+    if (!responseJson.ok) {
+      console.error(`Telegram delivery failed:`, responseJson)
+      return {
+        status: 502,
+        body: {
+          success: false,
+          error: `Telegram error: ${responseJson.description || 'Unknown error'}`,
+        },
+      }
+    }
+    return { status: 200, body: { success: true, message: 'Telegram message delivered successfully' } }
+  }
+
+  // Check response for non-Telegram webhooks
+  if (!response.ok) {
+    const errorText = await response.text().catch(() => 'Unknown error')
+    console.error(`Webhook delivery failed: ${response.status} - ${errorText}`)
+    return {
+      status: 502,
+      body: {
+        success: false,
+        error: `Webhook returned status ${response.status}`,
+        details: errorText.slice(0, 200),
+      },
+    }
+  }
+
+  return {
+    status: 200,
+    body: {
+      success: true,
+      message: 'Webhook delivered successfully',
+    },
+  }
+}
+
 export async function POST(request: NextRequest) {
   try {
     const body = (await request.json()) as RequestBody
-    const { webhookUrl, payload } = body
+    const { webhookUrl, payload, payloads } = body
 
     // Validate inputs
     if (!webhookUrl || typeof webhookUrl !== 'string') {
@@ -281,13 +370,23 @@ export async function POST(request: NextRequest) {
       )
     }
 
-    if (!payload || typeof payload !== 'object') {
+    const isBatch = payloads !== undefined
+    if (isBatch
+      ? !Array.isArray(payloads) || payloads.length === 0 || payloads.some(p => !p || typeof p !== 'object')
+      : !payload || typeof payload !== 'object') {
       return NextResponse.json(
         { success: false, error: 'Missing or invalid payload' },
         { status: 400 }
       )
     }
 
+    if (isBatch && payloads!.length > MAX_BATCH_PAYLOADS) {
+      return NextResponse.json(
+        { success: false, error: `Too many payloads (max ${MAX_BATCH_PAYLOADS})` },
+        { status: 400 }
+      )
+    }
+
     // Validate URL format
     try {
       new URL(webhookUrl)
@@ -298,75 +397,30 @@ export async function POST(request: NextRequest) {
       )
     }
 
-    // Build appropriate payload based on webhook type
-    let webhookPayload: object
-    let targetUrl = webhookUrl
-    let isTelegram = false
-
-    if (isTelegramWebhook(webhookUrl)) {
-      const parsed = parseTelegramUrl(webhookUrl)
-      if (!parsed) {
-        return NextResponse.json(
-          { success: false, error: 'Invalid Telegram URL. Expected format: https://api.telegram.org/bot<TOKEN>/sendMessage?chat_id=<CHAT_ID>' },
-          { status: 400 }
-        )
-      }
-      targetUrl = `https://api.telegram.org/bot${parsed.botToken}/sendMessage`
-      const telegramBody = buildTelegramPayload(payload)
-      webhookPayload = { chat_id: parsed.chatId, ...telegramBody }
-      isTelegram = true
-    } else if (isSlackWebhook(webhookUrl)) {
-      webhookPayload = buildSlackPayload(payload)
-    } else if (isDiscordWebhook(webhookUrl)) {
-      webhookPayload = buildDiscordPayload(payload)
-    } else {
-      // Generic webhook - send JSON payload
-      webhookPayload = buildGenericPayload(payload)
+    if (!isBatch) {
+      const result = await deliverWebhook(webhookUrl, payload!)
+      return NextResponse.json(result.body, { status: result.status })
     }
 
-    // Send webhook request
-    const response = await fetch(targetUrl, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-      },
-      body: JSON.stringify(webhookPayload),
-    })
-
-    // Check response — Telegram uses { ok: true/false } format
-    if (isTelegram) {
-      const responseJson = await response.json().catch(() => ({ ok: false, description: 'Failed to parse response' }))
-      if (!responseJson.ok) {
-        console.error(`Telegram delivery failed:`, responseJson)
-        return NextResponse.json(
-          {
-            success: false,
-            error: `Telegram error: ${responseJson.description || 'Unknown error'}`,
-          },
-          { status: 502 }
-        )
+    // Batch: deliver in order, paced by BATCH_DELIVERY_DELAY_MS, so a client with
+    // several fired alerts needs a single round trip
+    const results: DeliveryResult['body'][] = []
+    for (let i = 0; i < payloads!.length; i++) {
+      if (i > 0) await new Promise(resolve => setTimeout(resolve, BATCH_DELIVERY_DELAY_MS))
+      try {
+        results.push((await deliverWebhook(webhookUrl, payloads![i])).body)
+      } catch (error) {
+        results.push({ success: false, error: error instanceof Error ? error.message : 'Delivery failed' })
       }
-      return NextResponse.json({ success: true, message: 'Telegram message delivered successfully' })
     }
 
-    // Check response for non-Telegram webhooks
-    if (!response.ok) {
-      const errorText = await response.text().catch(() => 'Unknown error')
-      console.error(`Webhook delivery failed: ${response.status} - ${errorText}`)
-      return NextResponse.json(
-        {
-          success: false,
-          error: `Webhook returned status ${response.status}`,
-          details: errorText.slice(0, 200),
-        },
-        { status: 502 }
-      )
-    }
-
-    return NextResponse.json({
-      success: true,
-      message: 'Webhook delivered successfully',
-    })
+    // 200 when all delivered, 207 on partial delivery, 502 when nothing got through
+    const delivered = results.filter(r => r.success).length
+    const status = delivered === results.length ? 200 : delivered > 0 ? 207 : 502
+    return NextResponse.json(
+      { success: delivered === results.length, delivered, results },
+      { status }
+    )
   } catch (error) {
     console.error('Webhook API error:', error)
     return NextResponse.json(
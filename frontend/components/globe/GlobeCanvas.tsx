@@ -4,9 +4,8 @@ import { useRef, useEffect } from 'react'
 import * as THREE from 'three'
 // @ts-ignore - Three.js examples JSM module
 import { OrbitControls } from 'three/examples/jsm/controls/OrbitControls.js'
+import { latLngToVector3, createArcCurve } from './globeGeometry'
 import {
-  latLngToVector3,
-  createArcCurve,
   threatActors,
   energyFacilities,
   sectorColors,
@@ -1,5 +1,5 @@
 import * as THREE from 'three'
-import { latLngToVector3 } from './worldData'
+import { latLngToVector3 } from './globeGeometry'
 
 // ============================================================
 // Types
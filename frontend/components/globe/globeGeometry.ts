@@ -0,0 +1,32 @@
+// Three.js geometry helpers for the globe.
+// Kept out of worldData.ts so server code that only needs actor/facility data
+// (e.g. /api/threats) doesn't load three.js.
+
+import * as THREE from 'three'
+import type { GeoPoint, EnergyFacility } from './worldData'
+
+// Convert lat/lng to Three.js Vector3 on a sphere
+export function latLngToVector3(lat: number, lng: number, radius: number): THREE.Vector3 {
+  const phi = (90 - lat) * (Math.PI / 180)
+  const theta = (lng + 180) * (Math.PI / 180)
+  return new THREE.Vector3(
+    -(radius * Math.sin(phi) * Math.cos(theta)),
+    radius * Math.cos(phi),
+    radius * Math.sin(phi) * Math.sin(theta)
+  )
+}
+
+// Create a curved arc between two points on the globe
+export function createArcCurve(
+  source: GeoPoint,
+  target: GeoPoint | EnergyFacility,
+  radius: number,
+  elevation: number = 0.25
+): THREE.QuadraticBezierCurve3 {
+  const start = latLngToVector3(source.lat, source.lng, radius)
+  const end = latLngToVector3(target.lat, target.lng, radius)
+  const mid = new THREE.Vector3().addVectors(start, end).multiplyScalar(0.5)
+  const dist = start.distanceTo(end)
+  mid.normalize().multiplyScalar(radius + elevation + dist * 0.15)
+  return new THREE.QuadraticBezierCurve3(start, mid, end)
+}
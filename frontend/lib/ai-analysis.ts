@@ -80,7 +80,7 @@ export async function analyzeThreatsWithAI(items: ThreatItemInput[]): Promise<AI
       messages: [
         {
           role: 'user',
-          content: ANALYSIS_PROMPT + JSON.stringify(itemsForAnalysis, null, 2) + '\n\nRespond with a JSON array only, no other text.',
+          content: ANALYSIS_PROMPT + JSON.stringify(itemsForAnalysis) + '\n\nRespond with a JSON array only, no other text.',
         },
       ],
     })
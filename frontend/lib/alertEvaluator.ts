@@ -116,30 +116,42 @@ export async function dispatchAlerts(
   if (!config.webhookUrl || alerts.length === 0) return
 
   const now = Date.now()
-
-  for (const alert of alerts) {
-    try {
-      await fetch('/api/webhook', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          webhookUrl: config.webhookUrl,
-          payload: {
-            alertType: alert.alertType,
-            title: alert.title,
-            description: alert.description,
-            details: alert.details,
-            dashboardUrl: typeof window !== 'undefined' ? window.location.origin + '/globe' : '',
-            timestamp: new Date().toISOString(),
-          },
-        }),
+  const dashboardUrl = typeof window !== 'undefined' ? window.location.origin + '/globe' : ''
+  const timestamp = new Date().toISOString()
+
+  // One batched request for every fired alert instead of a round trip per alert
+  try {
+    const response = await fetch('/api/webhook', {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({
+        webhookUrl: config.webhookUrl,
+        payloads: alerts.map(alert => ({
+          alertType: alert.alertType,
+          title: alert.title,
+          description: alert.description,
+          details: alert.details,
+          dashboardUrl,
+          timestamp,
+        })),
+      }),
+    })
+
+    // Mark rules as triggered (cooldown)
+    for (const alert of alerts) config.lastTriggered[alert.rule.id] = now
+
+    // The batch endpoint answers 207 on partial delivery, so check per-payload results too
+    const result = await response.json().catch(() => null) as
+      { results?: { success: boolean; error?: string }[] } | null
+    if (result?.results) {
+      result.results.forEach((r, i) => {
+        if (!r.success) console.error(`Alert dispatch failed for rule ${alerts[i].rule.id}: ${r.error || 'Unknown error'}`)
       })
-
-      // Mark rule as triggered (cooldown)
-      config.lastTriggered[alert.rule.id] = now
-    } catch (err) {
-      console.error(`Failed to dispatch alert for rule ${alert.rule.id}:`, err)
+    } else if (!response.ok) {
+      console.error(`Alert dispatch failed: HTTP ${response.status}`)
     }
+  } catch (err) {
+    console.error(`Failed to dispatch alerts for rules ${alerts.map(a => a.rule.id).join(', ')}:`, err)
   }
 
   // Persist updated cooldowns
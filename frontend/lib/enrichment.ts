@@ -4,6 +4,8 @@
 
 import { ThreatItem } from './feeds'
 import { ENERGY_KEYWORDS, matchesIndicator } from './indicators'
+import { fetchWithRetry } from './http'
+import { classifySeverity } from './severity'
 
 export interface EnrichmentKeys {
   abuseIPDBKey?: string
@@ -43,7 +45,6 @@ const VT_HIGH_CATEGORIES = /\b(trojan|apt|rat|backdoor|exploit|botnet|infosteale
 const VT_ENERGY_CATEGORIES = /\b(industrial|scada|ics|plc|energy|critical.infrastructure)\b/i
 
 function extractSeverity(text: string): ThreatItem['severity'] {
-  const { classifySeverity } = require('./severity')
   return classifySeverity({ title: text, description: '', source: '', sourceType: 'vendor' })
 }
 
@@ -263,17 +264,13 @@ export async function fetchEPSSScores(cveIds: string[]): Promise<Map<string, { e
   const result = new Map<string, { epss: number; percentile: number }>()
   if (cveIds.length === 0) return result
 
-  const controller = new AbortController()
-  const timeoutId = setTimeout(() => controller.abort(), 10000)
-
   try {
     // Batch query — up to 100 CVEs per request
     const query = cveIds.slice(0, 100).join(',')
-    const response = await fetch(
+    const response = await fetchWithRetry(
       `https://api.first.org/data/v1/epss?cve=${query}`,
-      { cache: 'no-store', signal: controller.signal }
+      { cache: 'no-store' }
     )
-    clearTimeout(timeoutId)
     if (!response.ok) return result
 
     const json = await response.json()
@@ -284,7 +281,7 @@ export async function fetchEPSSScores(cveIds: string[]): Promise<Map<string, { e
       })
     }
   } catch {
-    clearTimeout(timeoutId)
+    // EPSS is best-effort; KEV items keep full weight without it
   }
   return result
 }
@@ -312,9 +309,8 @@ async function fetchGreyNoiseData(apiKey?: string, abuseIPs?: string[]): Promise
   const ipsToQuery = (abuseIPs || cachedAbuseIPs).slice(0, 5)
   if (ipsToQuery.length === 0) return []
 
-  const items: ThreatItem[] = []
-
-  for (const ip of ipsToQuery) {
+  // Single-IP lookups are independent — run them concurrently
+  const lookups = await Promise.all(ipsToQuery.map(async (ip): Promise<ThreatItem | null> => {
     try {
       const controller = new AbortController()
       const timeoutId = setTimeout(() => controller.abort(), 10000)
@@ -326,12 +322,12 @@ async function fetchGreyNoiseData(apiKey?: string, abuseIPs?: string[]): Promise
       })
       clearTimeout(timeoutId)
 
-      if (!response.ok) continue
+      if (!response.ok) return null
       const data = await response.json()
 
       // Only create items for IPs classified as malicious
       if (data.classification === 'malicious') {
-        items.push({
+        return {
           id: `GN-${ip.replace(/\./g, '-')}`,
           title: `Active Scanner: ${ip} — ${data.name || 'Unknown Actor'} (GreyNoise)`,
           description: `IP ${ip} classified as malicious by GreyNoise. ${data.name ? `Known as: ${data.name}.` : ''} Last seen: ${data.last_seen || 'recently'}. This IP is conducting active internet-wide scanning.`,
@@ -341,12 +337,14 @@ async function fetchGreyNoiseData(apiKey?: string, abuseIPs?: string[]): Promise
           sourceType: 'vendor' as const,
           severity: 'high' as const,
           isEnergyRelevant: true, // Only querying IPs already flagged from nation-state origins
-        })
+        }
       }
     } catch {
       // Skip individual IP failures silently
     }
-  }
+    return null
+  }))
+  const items = lookups.filter((item): item is ThreatItem => item !== null)
 
   if (!apiKey) {
     greyNoiseCache = { items, timestamp: Date.now() }
@@ -76,6 +76,8 @@ const FEED_SOURCES = [
 
 import { ENERGY_KEYWORDS, matchesIndicator, isEnergyRelevantKEV } from './indicators'
 import { fetchSocialThreats } from './social-feeds'
+import { fetchWithRetry, toISODate } from './http'
+import { classifySeverity } from './severity'
 
 // djb2 hash for deterministic RSS item IDs (stable across fetches)
 function hashString(str: string): string {
@@ -95,7 +97,6 @@ function checkEnergyRelevance(title: string, description: string): boolean {
 // This wrapper provides backward-compatible signature for initial feed parsing
 // (before AI/EPSS scores are available). Post-AI reconciliation happens in the API route.
 function extractSeverity(title: string, description: string, source?: string, sourceType?: ThreatItem['sourceType']): ThreatItem['severity'] {
-  const { classifySeverity } = require('./severity')
   return classifySeverity({
     title,
     description,
@@ -104,25 +105,87 @@ function extractSeverity(title: string, description: string, source?: string, so
   })
 }
 
+// RSS field patterns compiled once at module load rather than on every item
+const RSS_ITEM_RE = /<item>([\s\S]*?)<\/item>/gi
+// Counts closed items while streaming — case-insensitive, same as RSS_ITEM_RE
+const RSS_ITEM_CLOSE_RE = /<\/item>/gi
+const RSS_ITEM_CLOSE_LEN = '</item>'.length
+const RSS_TITLE_CDATA_RE = /<title><!\[CDATA\[(.*?)\]\]><\/title>/
+const RSS_TITLE_RE = /<title>(.*?)<\/title>/
+const RSS_LINK_RE = /<link>(.*?)<\/link>/
+const RSS_LINK_CDATA_RE = /<link><!\[CDATA\[(.*?)\]\]><\/link>/
+const RSS_DESC_CDATA_RE = /<description><!\[CDATA\[([\s\S]*?)\]\]><\/description>/
+const RSS_DESC_RE = /<description>([\s\S]*?)<\/description>/
+const RSS_PUBDATE_RE = /<pubDate>(.*?)<\/pubDate>/
+const RSS_DC_DATE_RE = /<dc:date>(.*?)<\/dc:date>/
+const HTML_TAG_RE = /<[^>]*>/g
+
+// Only the newest items of each RSS feed are scored
+const MAX_RSS_ITEMS = 15
+// Hard cap on buffered RSS text, so a huge or malformed feed that never reaches
+// MAX_RSS_ITEMS closed items is cut off instead of being buffered in full
+const MAX_RSS_BYTES = 2 * 1024 * 1024
+
+// Item date from <pubDate> (RFC 822) or <dc:date> (ISO 8601)
+function parseItemDate(itemXml: string): string {
+  const dateMatch = itemXml.match(RSS_PUBDATE_RE) || itemXml.match(RSS_DC_DATE_RE)
+  return toISODate(dateMatch?.[1])
+}
+
+// Stream an RSS body and stop reading once enough complete <item> elements have arrived,
+// so large advisory feeds aren't fully buffered when only the newest items are used
+async function readRSSText(response: Response, maxItems: number): Promise<string> {
+  if (!response.body) return response.text()
+
+  const reader = response.body.getReader()
+  const decoder = new TextDecoder()
+  let xml = ''
+  let itemCount = 0
+  let scanFrom = 0
+  let bytesRead = 0
+
+  while (true) {
+    const { done, value } = await reader.read()
+    if (done) break
+    bytesRead += value.byteLength
+    xml += decoder.decode(value, { stream: true })
+
+    RSS_ITEM_CLOSE_RE.lastIndex = scanFrom
+    while (RSS_ITEM_CLOSE_RE.exec(xml) !== null) {
+      itemCount++
+      scanFrom = RSS_ITEM_CLOSE_RE.lastIndex
+    }
+    if (itemCount >= maxItems || bytesRead >= MAX_RSS_BYTES) {
+      await reader.cancel()
+      return xml
+    }
+    // Re-scan only the tail that could hold a closing tag split across chunks
+    scanFrom = Math.max(scanFrom, xml.length - RSS_ITEM_CLOSE_LEN)
+  }
+
+  return xml + decoder.decode()
+}
+
 function parseRSS(xml: string, sourceName: string, sourceType: ThreatItem['sourceType']): ThreatItem[] {
   const items: ThreatItem[] = []
-  const itemRegex = /<item>([\s\S]*?)<\/item>/gi
+  RSS_ITEM_RE.lastIndex = 0
   let match
 
-  while ((match = itemRegex.exec(xml)) !== null) {
+  while ((match = RSS_ITEM_RE.exec(xml)) !== null) {
     const itemXml = match[1]
+    // Only try the CDATA variants when the item actually contains CDATA sections
+    const hasCDATA = itemXml.includes('<![CDATA[')
 
-    const titleMatch = itemXml.match(/<title><!\[CDATA\[(.*?)\]\]><\/title>/) || itemXml.match(/<title>(.*?)<\/title>/)
-    const title = titleMatch ? titleMatch[1].replace(/<[^>]*>/g, '').trim() : 'Untitled'
+    const titleMatch = (hasCDATA && itemXml.match(RSS_TITLE_CDATA_RE)) || itemXml.match(RSS_TITLE_RE)
+    const title = titleMatch ? titleMatch[1].replace(HTML_TAG_RE, '').trim() : 'Untitled'
 
-    const linkMatch = itemXml.match(/<link>(.*?)<\/link>/) || itemXml.match(/<link><!\[CDATA\[(.*?)\]\]><\/link>/)
+    const linkMatch = itemXml.match(RSS_LINK_RE) || (hasCDATA && itemXml.match(RSS_LINK_CDATA_RE))
     const link = linkMatch ? linkMatch[1].trim() : ''
 
-    const descMatch = itemXml.match(/<description><!\[CDATA\[([\s\S]*?)\]\]><\/description>/) || itemXml.match(/<description>([\s\S]*?)<\/description>/)
-    const description = descMatch ? descMatch[1].replace(/<[^>]*>/g, '').substring(0, 500).trim() : ''
+    const descMatch = (hasCDATA && itemXml.match(RSS_DESC_CDATA_RE)) || itemXml.match(RSS_DESC_RE)
+    const description = descMatch ? descMatch[1].replace(HTML_TAG_RE, '').substring(0, 500).trim() : ''
 
-    const dateMatch = itemXml.match(/<pubDate>(.*?)<\/pubDate>/)
-    const pubDate = dateMatch ? new Date(dateMatch[1]).toISOString() : new Date().toISOString()
+    const pubDate = parseItemDate(itemXml)
 
     items.push({
       id: sourceName.replace(/\s/g, '-') + '-' + hashString(sourceName + (link || title)),
@@ -138,7 +201,7 @@ function parseRSS(xml: string, sourceName: string, sourceType: ThreatItem['sourc
     })
   }
 
-  return items.slice(0, 15)
+  return items.slice(0, MAX_RSS_ITEMS)
 }
 
 function parseOTX(json: any, sourceName: string, sourceType: ThreatItem['sourceType']): ThreatItem[] {
@@ -207,25 +270,25 @@ export async function fetchAllFeeds(): Promise<FeedResult> {
 
   const fetchPromises = FEED_SOURCES.map(async (source) => {
     try {
-      // 10-second timeout to prevent slow feeds from blocking
-      const controller = new AbortController()
-      const timeoutId = setTimeout(() => controller.abort(), 10000)
-
       const headers: Record<string, string> = { 'User-Agent': 'CAPRI/1.0' }
       if (source.type === 'otx' && process.env.OTX_API_KEY) {
         headers['X-OTX-API-KEY'] = process.env.OTX_API_KEY
       }
 
-      const response = await fetch(source.url, {
+      // 10-second timeout (default) to prevent slow feeds from blocking; 5xx responses are retried
+      const response = await fetchWithRetry(source.url, {
         headers,
         cache: 'no-store',
-        signal: controller.signal
       })
 
-      clearTimeout(timeoutId)
-
       if (!response.ok) throw new Error('HTTP ' + response.status)
 
+      if (source.type === 'rss') {
+        const xml = await readRSSText(response, MAX_RSS_ITEMS)
+        sourcesOnline++
+        return parseRSS(xml, source.name, source.sourceType)
+      }
+
       const text = await response.text()
       sourcesOnline++
 
@@ -250,11 +313,9 @@ export async function fetchAllFeeds(): Promise<FeedResult> {
             knownRansomwareCampaignUse: v.knownRansomwareCampaignUse || 'Unknown'
           }))
         return parseKEV(json)
-      } else if (source.type === 'otx') {
+      } else {
         const json = JSON.parse(text)
         return parseOTX(json, source.name, source.sourceType)
-      } else {
-        return parseRSS(text, source.name, source.sourceType)
       }
     } catch (error) {
       errors.push(source.name + ': ' + (error instanceof Error ? error.message : 'Failed'))
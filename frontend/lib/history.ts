@@ -9,16 +9,75 @@ export interface ScoreSnapshot {
 
 const STORAGE_KEY = 'capri-score-history'
 const MAX_AGE_DAYS = 30
+const PERSIST_DEBOUNCE_MS = 50
+
+// Parsed history kept in memory so saves append instead of re-parsing localStorage
+let cachedHistory: ScoreSnapshot[] | null = null
+let persistTimer: ReturnType<typeof setTimeout> | null = null
+
+// Coalesce localStorage writes behind a short timer so serialization stays off the render path
+function schedulePersist(): void {
+  if (persistTimer) return
+  persistTimer = setTimeout(flushHistory, PERSIST_DEBOUNCE_MS)
+}
+
+export function flushHistory(): void {
+  if (persistTimer) {
+    clearTimeout(persistTimer)
+    persistTimer = null
+  }
+  if (typeof window === 'undefined' || !cachedHistory) return
+  try {
+    localStorage.setItem(STORAGE_KEY, JSON.stringify(cachedHistory))
+  } catch {}
+}
+
+if (typeof window !== 'undefined') {
+  // Flush any pending write before the page is unloaded or frozen
+  window.addEventListener('pagehide', flushHistory)
+  // Another tab rewrote the history — drop the parsed copy so the next read re-parses it once.
+  // With a write still pending, adopt the other tab's history and re-append our unsaved
+  // entries instead, so the scheduled flush doesn't lose either side.
+  window.addEventListener('storage', event => {
+    if (event.key !== STORAGE_KEY && event.key !== null) return
+    if (!persistTimer || !cachedHistory) {
+      cachedHistory = null
+      return
+    }
+    const incoming = parseHistory(event.key === null ? null : event.newValue)
+    const lastTimestamp = incoming.length > 0 ? incoming[incoming.length - 1].timestamp : ''
+    cachedHistory = incoming.concat(cachedHistory.filter(entry => entry.timestamp > lastTimestamp))
+  })
+}
+
+function parseHistory(stored: string | null): ScoreSnapshot[] {
+  try {
+    return stored ? JSON.parse(stored) : []
+  } catch {
+    return []
+  }
+}
+
+// Live cached array — internal callers may mutate it, external callers get a copy
+function loadHistory(): ScoreSnapshot[] {
+  if (cachedHistory) return cachedHistory
+  try {
+    cachedHistory = parseHistory(localStorage.getItem(STORAGE_KEY))
+  } catch {
+    cachedHistory = []
+  }
+  return cachedHistory
+}
 
 export function saveScore(score: number, label: string): void {
   if (typeof window === 'undefined') return
 
-  const history = getHistory()
+  const history = loadHistory()
 
-  // Avoid duplicate entries within 5 minutes
+  // Avoid duplicate entries within 5 minutes (history is append-only, so only the last entry can be that recent)
   const fiveMinutesAgo = Date.now() - 5 * 60 * 1000
-  const recentEntry = history.find(h => new Date(h.timestamp).getTime() > fiveMinutesAgo)
-  if (recentEntry) return
+  const lastEntry = history[history.length - 1]
+  if (lastEntry && new Date(lastEntry.timestamp).getTime() > fiveMinutesAgo) return
 
   history.push({
     timestamp: new Date().toISOString(),
@@ -26,31 +85,32 @@ export function saveScore(score: number, label: string): void {
     label
   })
 
-  // Keep last 30 days only
+  // Keep last 30 days only — entries are chronological, so drop expired ones from the front
   const cutoff = Date.now() - MAX_AGE_DAYS * 24 * 60 * 60 * 1000
-  const trimmed = history.filter(h => new Date(h.timestamp).getTime() > cutoff)
+  let expired = 0
+  while (expired < history.length && new Date(history[expired].timestamp).getTime() <= cutoff) expired++
+  if (expired > 0) history.splice(0, expired)
 
-  localStorage.setItem(STORAGE_KEY, JSON.stringify(trimmed))
+  schedulePersist()
 }
 
 export function getHistory(): ScoreSnapshot[] {
   if (typeof window === 'undefined') return []
-
-  try {
-    const stored = localStorage.getItem(STORAGE_KEY)
-    return stored ? JSON.parse(stored) : []
-  } catch {
-    return []
-  }
+  return loadHistory().slice()
 }
 
 export function clearHistory(): void {
   if (typeof window === 'undefined') return
+  if (persistTimer) {
+    clearTimeout(persistTimer)
+    persistTimer = null
+  }
+  cachedHistory = null
   localStorage.removeItem(STORAGE_KEY)
 }
 
 export function getLatestScore(): ScoreSnapshot | null {
-  const history = getHistory()
+  if (typeof window === 'undefined') return null
+  const history = loadHistory()
   return history.length > 0 ? history[history.length - 1] : null
 }
-
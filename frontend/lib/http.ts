@@ -0,0 +1,42 @@
+// CAPRI Shared Feed HTTP Client
+// Single fetch wrapper for public feed sources: request timeout plus retry with
+// exponential backoff on transient upstream errors (500/502/503/504).
+// Node's fetch keeps connections alive per origin, so retries and repeat polls
+// against the same host (e.g. cisa.gov) reuse the pooled TLS connection.
+// Also holds the date normalization shared by every feed parser.
+
+const RETRY_STATUSES = new Set([500, 502, 503, 504])
+
+export interface FeedFetchOptions extends RequestInit {
+  timeoutMs?: number   // overall deadline across all attempts (default 10s)
+  retries?: number     // retries after the first attempt on 5xx (default 3)
+  backoffMs?: number   // first backoff delay, doubled per retry (default 300ms)
+}
+
+export async function fetchWithRetry(url: string, options: FeedFetchOptions = {}): Promise<Response> {
+  const { timeoutMs = 10000, retries = 3, backoffMs = 300, ...init } = options
+
+  // One deadline for every attempt so retries can't stretch a slow feed past the timeout
+  const controller = new AbortController()
+  const timeoutId = setTimeout(() => controller.abort(), timeoutMs)
+
+  try {
+    for (let attempt = 0; ; attempt++) {
+      const response = await fetch(url, { ...init, signal: controller.signal })
+      if (!RETRY_STATUSES.has(response.status) || attempt >= retries) return response
+
+      // Release the failed body so its connection goes back to the pool
+      await response.body?.cancel().catch(() => {})
+      await new Promise(resolve => setTimeout(resolve, backoffMs * 2 ** attempt))
+    }
+  } finally {
+    clearTimeout(timeoutId)
+  }
+}
+
+// Normalize a feed-supplied date to ISO 8601; missing or unparseable dates fall back
+// to now rather than throwing and dropping the whole feed
+export function toISODate(raw: string | null | undefined): string {
+  const date = raw ? new Date(raw.trim()) : null
+  return date && !isNaN(date.getTime()) ? date.toISOString() : new Date().toISOString()
+}
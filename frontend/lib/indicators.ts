@@ -98,6 +98,9 @@ const CONTEXTUAL_VULN_TERMS = [
   'authentication bypass', 'remote code execution',
 ] as const
 
+// Context terms that qualify a contextual vuln term — built once, not per KEV check
+const ENERGY_CONTEXT_TERMS = [...ICS_TERMS, ...ICS_VENDORS, ...ENERGY_SECTOR_VENDORS] as const
+
 // Word-boundary regex matcher with shared cache.
 // Prevents false positives (e.g., 'ics' won't match 'logistics', 'oil' won't match 'soil').
 const _regexCache = new Map<string, RegExp>()
@@ -117,14 +120,10 @@ export function matchesIndicator(text: string, indicator: string): boolean {
  * Prevents "Siemens earnings report" from triggering ICS classification.
  */
 export function matchesICSContext(text: string): boolean {
-  const lower = text.toLowerCase()
-  // Direct ICS terms — always match
-  if (ICS_TERMS.some(term => matchesIndicator(lower, term))) return true
-  // Vendor names — only match if an ICS context term is also present
-  if (ICS_VENDORS.some(vendor => matchesIndicator(lower, vendor))) {
-    return ICS_TERMS.some(term => matchesIndicator(lower, term))
-  }
-  return false
+  // Direct ICS terms — always match. A vendor name only counts alongside an ICS term,
+  // which this check already covers, so vendor-only text needs no second scan.
+  // (matchesIndicator regexes are case-insensitive, so no lowercased copy is needed.)
+  return ICS_TERMS.some(term => matchesIndicator(text, term))
 }
 
 /**
@@ -148,8 +147,7 @@ export function isEnergyRelevantKEV(vendor: string, description: string, product
   if (ENERGY_KEYWORDS.some(kw => matchesIndicator(text, kw))) return true
   // Contextual vuln terms — only match when paired with an energy/ICS indicator
   if (CONTEXTUAL_VULN_TERMS.some(term => matchesIndicator(text, term))) {
-    const hasEnergyContext = [...ICS_TERMS, ...ICS_VENDORS, ...ENERGY_SECTOR_VENDORS]
-      .some(ctx => matchesIndicator(text, ctx))
+    const hasEnergyContext = ENERGY_CONTEXT_TERMS.some(ctx => matchesIndicator(text, ctx))
     if (hasEnergyContext) return true
   }
   return false
@@ -77,13 +77,55 @@ export interface ScoreFactor {
 }
 
 // Temporal decay: newer threats weigh more than older ones
-function getTemporalDecay(pubDate: string): number {
-  const ageMs = Date.now() - new Date(pubDate).getTime()
+// [max age in days, weight] — first step whose age bound covers the item wins
+const DECAY_STEPS: readonly (readonly [number, number])[] = [
+  [3, 1.0],    // 0-3 days: full weight
+  [7, 0.75],   // 4-7 days: 75%
+  [14, 0.5],   // 8-14 days: 50%
+]
+const DECAY_FLOOR = 0.25 // 15-30 days: 25%
+
+function getTemporalDecay(pubDate: string, now: number): number {
+  const ageMs = now - new Date(pubDate).getTime()
   const ageDays = ageMs / (1000 * 60 * 60 * 24)
-  if (ageDays <= 3) return 1.0    // 0-3 days: full weight
-  if (ageDays <= 7) return 0.75   // 4-7 days: 75%
-  if (ageDays <= 14) return 0.5   // 8-14 days: 50%
-  return 0.25                      // 15-30 days: 25%
+  for (const [maxDays, weight] of DECAY_STEPS) {
+    if (ageDays <= maxDays) return weight
+  }
+  return DECAY_FLOOR
+}
+
+// Score bands ordered by upper bound; scores above every band (shouldn't happen) read as Normal
+const SCORE_BANDS = [SCORE_THRESHOLDS.severe, SCORE_THRESHOLDS.elevated, SCORE_THRESHOLDS.normal]
+
+function getScoreBand(score: number): { max: number; color: string; label: string } {
+  for (const band of SCORE_BANDS) {
+    if (score <= band.max) return band
+  }
+  return SCORE_THRESHOLDS.normal
+}
+
+// Factor deduction: per-item weight × optional multiplier × temporal decay, summed and capped.
+// Weights come straight from SCORING_WEIGHTS so the published methodology is what gets applied.
+function cappedImpact(
+  items: ThreatItem[],
+  weight: { perItem: number; maxImpact: number },
+  now: number,
+  multiplier?: (item: ThreatItem) => number
+): number {
+  const perItem = -weight.perItem
+  let total = 0
+  for (const item of items) {
+    total += perItem * (multiplier ? multiplier(item) : 1) * getTemporalDecay(item.pubDate, now)
+  }
+  return Math.min(total, -weight.maxImpact)
+}
+
+// Weight KEVs by EPSS score: high EPSS = full deduction, low = reduced
+function epssMultiplier(item: ThreatItem): number {
+  if (item.epssScore === undefined) return 1.0 // Default full weight when no EPSS data
+  if (item.epssScore >= 0.5) return 1.0         // High exploitation probability
+  if (item.epssScore >= 0.1) return 0.7         // Moderate probability
+  return 0.4                                    // Low probability
 }
 
 export function calculateEnergyScore(items: ThreatItem[]): ScoreResult {
@@ -92,6 +134,7 @@ export function calculateEnergyScore(items: ThreatItem[]): ScoreResult {
   const usedItemIds = new Set<string>() // Track items to prevent double-counting
 
   const now = new Date()
+  const nowMs = now.getTime()
   const sevenDaysAgo = new Date(now.getTime() - 7 * 24 * 60 * 60 * 1000)
   const thirtyDaysAgo = new Date(now.getTime() - 30 * 24 * 60 * 60 * 1000)
 
@@ -122,8 +165,7 @@ export function calculateEnergyScore(items: ThreatItem[]): ScoreResult {
     return matches
   })
   {
-    const decayedImpact = nationStateThreats.reduce((sum, item) => sum + (0.4 * getTemporalDecay(item.pubDate)), 0)
-    const impact = Math.min(decayedImpact, 0.8)
+    const impact = cappedImpact(nationStateThreats, SCORING_WEIGHTS.nationState, nowMs)
     score -= impact
     factors.push({
       name: 'Nation-State Activity',
@@ -145,18 +187,7 @@ export function calculateEnergyScore(items: ThreatItem[]): ScoreResult {
     return matches
   })
   {
-    const decayedImpact = recentKEVs.reduce((sum, item) => {
-      const baseWeight = 0.3
-      // Weight by EPSS score: high EPSS = full deduction, low = reduced
-      let epssMultiplier = 1.0 // Default full weight when no EPSS data
-      if (item.epssScore !== undefined) {
-        if (item.epssScore >= 0.5) epssMultiplier = 1.0      // High exploitation probability
-        else if (item.epssScore >= 0.1) epssMultiplier = 0.7  // Moderate probability
-        else epssMultiplier = 0.4                              // Low probability
-      }
-      return sum + (baseWeight * epssMultiplier * getTemporalDecay(item.pubDate))
-    }, 0)
-    const impact = Math.min(decayedImpact, 1.2)
+    const impact = cappedImpact(recentKEVs, SCORING_WEIGHTS.kevEntry, nowMs, epssMultiplier)
     score -= impact
     factors.push({
       name: 'CISA KEV Entries',
@@ -179,8 +210,7 @@ export function calculateEnergyScore(items: ThreatItem[]): ScoreResult {
     return matches
   })
   {
-    const decayedImpact = icsThreats.reduce((sum, item) => sum + (0.3 * getTemporalDecay(item.pubDate)), 0)
-    const impact = Math.min(decayedImpact, 0.6)
+    const impact = cappedImpact(icsThreats, SCORING_WEIGHTS.icsScada, nowMs)
     score -= impact
     factors.push({
       name: 'ICS/SCADA Vulnerabilities',
@@ -202,8 +232,7 @@ export function calculateEnergyScore(items: ThreatItem[]): ScoreResult {
     return matches
   })
   {
-    const decayedImpact = criticalVendorItems.reduce((sum, item) => sum + (0.15 * getTemporalDecay(item.pubDate)), 0)
-    const impact = Math.min(decayedImpact, 0.4)
+    const impact = cappedImpact(criticalVendorItems, SCORING_WEIGHTS.vendorCritical, nowMs)
     score -= impact
     factors.push({
       name: 'Vendor Critical Alerts',
@@ -221,19 +250,9 @@ export function calculateEnergyScore(items: ThreatItem[]): ScoreResult {
   score = Math.round(score * 10) / 10 // Round to 1 decimal
 
   // Determine label and color
-  let label: ScoreResult['label']
-  let color: string
-
-  if (score <= 2.0) {
-    label = 'Severe'
-    color = '#d92525'
-  } else if (score <= 3.0) {
-    label = 'Elevated'
-    color = '#f59e0b'
-  } else {
-    label = 'Normal'
-    color = '#16a34a'
-  }
+  const band = getScoreBand(score)
+  const label = band.label as ScoreResult['label']
+  const color = band.color
 
   // Generate summary
   const energyRelevantCount = recentItems.filter(item => item.isEnergyRelevant).length
@@ -267,13 +286,9 @@ function generateSummary(
 }
 
 export function getScoreColor(score: number): string {
-  if (score <= 2.0) return '#d92525'
-  if (score <= 3.0) return '#f59e0b'
-  return '#16a34a'
+  return getScoreBand(score).color
 }
 
 export function getScoreLabel(score: number): string {
-  if (score <= 2.0) return 'Severe'
-  if (score <= 3.0) return 'Elevated'
-  return 'Normal'
+  return getScoreBand(score).label
 }
\ No newline at end of file
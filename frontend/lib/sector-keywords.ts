@@ -192,6 +192,28 @@ const ALL_SECTORS: EnergySector[] = [
   'offshore_wind', 'storage', 'coal', 'geothermal', 'biomass', 'other',
 ]
 
+// ── Precomputed lookup tables ──
+// Built once at module load instead of Object.entries() on every classification.
+// Keywords are lowercased: matching is case-insensitive either way, but lowercase keys
+// let 'SCADA'/'scada' or 'Triton'/'triton' share one compiled regex in matchesIndicator's cache.
+
+type SectorLookup = readonly (readonly [string, readonly EnergySector[]])[]
+
+// Frozen all the way down (table, entry tuples, value arrays); sector arrays are copied
+// rather than freezing the *_TO_SECTORS source maps in place
+const KEYWORD_TO_SECTOR: readonly (readonly [EnergySector, readonly string[]])[] = Object.freeze(
+  (Object.entries(SECTOR_KEYWORD_MAP) as [EnergySector, string[]][])
+    .map(([sector, keywords]) => Object.freeze([sector, Object.freeze(keywords.map(kw => kw.toLowerCase()))] as const))
+)
+
+function buildSectorLookup(map: Record<string, EnergySector[]>): SectorLookup {
+  return Object.freeze(Object.entries(map).map(([key, sectors]) =>
+    Object.freeze([key.toLowerCase(), Object.freeze(sectors.slice())] as const)))
+}
+
+const VENDOR_SECTOR_LOOKUP = buildSectorLookup(VENDOR_TO_SECTORS)
+const EQUIPMENT_SECTOR_LOOKUP = buildSectorLookup(EQUIPMENT_TO_SECTORS)
+
 /**
  * Classify a threat item into matching energy sectors using tiered intelligence:
  * 1.  Direct sector keywords (nuclear, pipeline, etc.)
@@ -205,14 +227,14 @@ export function classifyThreatBySector(title: string, description: string): Ener
   const sectorSet = new Set<EnergySector>()
 
   // Tier 1: Direct sector keyword match
-  for (const [sector, keywords] of Object.entries(SECTOR_KEYWORD_MAP)) {
+  for (const [sector, keywords] of KEYWORD_TO_SECTOR) {
     if (keywords.some(kw => matchesIndicator(text, kw))) {
-      sectorSet.add(sector as EnergySector)
+      sectorSet.add(sector)
     }
   }
 
   // Tier 2: Vendor-to-sector inference
-  for (const [vendor, sectors] of Object.entries(VENDOR_TO_SECTORS)) {
+  for (const [vendor, sectors] of VENDOR_SECTOR_LOOKUP) {
     if (matchesIndicator(text, vendor)) {
       for (const s of sectors) sectorSet.add(s)
     }
@@ -229,7 +251,7 @@ export function classifyThreatBySector(title: string, description: string): Ener
   }
 
   // Tier 4: Equipment-based inference
-  for (const [equipment, sectors] of Object.entries(EQUIPMENT_TO_SECTORS)) {
+  for (const [equipment, sectors] of EQUIPMENT_SECTOR_LOOKUP) {
     if (matchesIndicator(text, equipment)) {
       for (const s of sectors) sectorSet.add(s)
     }
@@ -16,6 +16,24 @@ interface SeverityInput {
 
 type Severity = 'critical' | 'high' | 'medium' | 'low' | 'unknown'
 
+// Keyword classification is a pure function of the item text, and the same items are
+// re-classified on every feed parse, cron run and post-AI reconciliation — memoize it.
+// Bounded: Map keeps insertion order, so the oldest entry is evicted first.
+const KEYWORD_CACHE_MAX = 4096
+const keywordSeverityCache = new Map<string, Severity>()
+
+function classifyByKeywordsCached(text: string): Severity {
+  const cached = keywordSeverityCache.get(text)
+  if (cached !== undefined) return cached
+
+  const severity = classifyByKeywords(text)
+  if (keywordSeverityCache.size >= KEYWORD_CACHE_MAX) {
+    keywordSeverityCache.delete(keywordSeverityCache.keys().next().value!)
+  }
+  keywordSeverityCache.set(text, severity)
+  return severity
+}
+
 /**
  * Multi-signal severity classifier.
  * Priority: AI score > EPSS > KEV status > refined keywords > source tier > fallback.
@@ -45,7 +63,7 @@ export function classifySeverity(input: SeverityInput): Severity {
 
   // 4. Refined keyword analysis
   const text = (input.title + ' ' + input.description).toLowerCase()
-  const severity = classifyByKeywords(text)
+  const severity = classifyByKeywordsCached(text)
 
   // 5. Source tier boost: government advisories get +1 tier
   if (input.sourceType === 'government' && severity === 'medium') return 'high'
@@ -11,6 +11,7 @@ import {
   matchesIndicator,
 } from './indicators'
 import type { EnergySector } from '@/components/map/types'
+import { fetchWithRetry, toISODate } from './http'
 
 // ── In-memory cache (15-minute TTL, same pattern as EIA-930) ──
 
@@ -93,28 +94,22 @@ const BLUESKY_QUERIES = [
 ]
 
 async function fetchBluesky(): Promise<any[]> {
-  const items: any[] = []
-
-  for (const query of BLUESKY_QUERIES) {
+  // Queries are independent — fetch them concurrently rather than one after another
+  const batches = await Promise.all(BLUESKY_QUERIES.map(async (query) => {
+    const items: any[] = []
     try {
-      const controller = new AbortController()
-      const timeoutId = setTimeout(() => controller.abort(), 10000)
-
       const params = new URLSearchParams({ q: query, limit: '25' })
-      const response = await fetch(
+      const response = await fetchWithRetry(
         `https://public.api.bsky.app/xrpc/app.bsky.feed.searchPosts?${params}`,
         {
           headers: { 'User-Agent': 'CAPRI/1.0' },
           cache: 'no-store',
-          signal: controller.signal,
         }
       )
 
-      clearTimeout(timeoutId)
-
       if (!response.ok) {
         console.error(`Bluesky query "${query}" failed: HTTP ${response.status}`)
-        continue
+        return items
       }
 
       const data = await response.json()
@@ -124,7 +119,7 @@ async function fetchBluesky(): Promise<any[]> {
         const record = post.record || {}
         const text = record.text || ''
         const author = post.author?.handle || 'unknown'
-        const createdAt = record.createdAt || new Date().toISOString()
+        const createdAt = toISODate(record.createdAt)
         const uri = post.uri || ''
 
         // Build a web link from the AT URI: at://did/app.bsky.feed.post/rkey
@@ -155,7 +150,7 @@ async function fetchBluesky(): Promise<any[]> {
           title,
           description,
           link,
-          pubDate: new Date(createdAt).toISOString(),
+          pubDate: createdAt,
           source: 'Bluesky',
           sourceType: 'social' as const,
           severity: classifySeverity({
@@ -171,9 +166,10 @@ async function fetchBluesky(): Promise<any[]> {
     } catch (error) {
       console.error(`Bluesky query "${query}" error:`, error instanceof Error ? error.message : 'Failed')
     }
-  }
+    return items
+  }))
 
-  return items
+  return batches.flat()
 }
 
 // ── Mastodon (infosec.exchange public API) ──
@@ -182,27 +178,21 @@ const MASTODON_TAGS = ['infosec', 'ics', 'scada', 'cybersecurity']
 const MASTODON_INSTANCE = 'https://infosec.exchange'
 
 async function fetchMastodon(): Promise<any[]> {
-  const items: any[] = []
-
-  for (const tag of MASTODON_TAGS) {
+  // Tags are independent — fetch them concurrently rather than one after another
+  const batches = await Promise.all(MASTODON_TAGS.map(async (tag) => {
+    const items: any[] = []
     try {
-      const controller = new AbortController()
-      const timeoutId = setTimeout(() => controller.abort(), 10000)
-
-      const response = await fetch(
+      const response = await fetchWithRetry(
         `${MASTODON_INSTANCE}/api/v1/timelines/tag/${tag}?limit=20`,
         {
           headers: { 'User-Agent': 'CAPRI/1.0' },
           cache: 'no-store',
-          signal: controller.signal,
         }
       )
 
-      clearTimeout(timeoutId)
-
       if (!response.ok) {
         console.error(`Mastodon tag #${tag} failed: HTTP ${response.status}`)
-        continue
+        return items
       }
 
       const toots: any[] = await response.json()
@@ -212,7 +202,7 @@ async function fetchMastodon(): Promise<any[]> {
         const rawContent = (toot.content || '').replace(/<[^>]*>/g, '')
         const account = toot.account?.acct || 'unknown'
         const link = toot.url || toot.uri || ''
-        const createdAt = toot.created_at || new Date().toISOString()
+        const createdAt = toISODate(toot.created_at)
 
         if (!passesNoiseFilter(rawContent)) continue
 
@@ -226,7 +216,7 @@ async function fetchMastodon(): Promise<any[]> {
           title,
           description: `[${account}] ${description}`,
           link,
-          pubDate: new Date(createdAt).toISOString(),
+          pubDate: createdAt,
           source: 'Mastodon (infosec.exchange)',
           sourceType: 'social' as const,
           severity: classifySeverity({
@@ -242,9 +232,10 @@ async function fetchMastodon(): Promise<any[]> {
     } catch (error) {
       console.error(`Mastodon tag #${tag} error:`, error instanceof Error ? error.message : 'Failed')
     }
-  }
+    return items
+  }))
 
-  return items
+  return batches.flat()
 }
 
 // ── Reddit RSS ──
@@ -254,58 +245,63 @@ const REDDIT_FEEDS = [
   { url: 'https://www.reddit.com/r/cybersecurity/.rss', name: 'Reddit r/cybersecurity' },
 ]
 
-async function fetchReddit(): Promise<any[]> {
-  const items: any[] = []
+// Atom field patterns compiled once at module load rather than on every entry
+const ATOM_ENTRY_RE = /<entry>([\s\S]*?)<\/entry>/gi
+const ATOM_TITLE_RE = /<title>([\s\S]*?)<\/title>/
+const ATOM_LINK_RE = /<link\s+href="([^"]*)"/
+const ATOM_CONTENT_RE = /<content[^>]*>([\s\S]*?)<\/content>/
+const ATOM_SUMMARY_RE = /<summary[^>]*>([\s\S]*?)<\/summary>/
+const ATOM_UPDATED_RE = /<updated>([\s\S]*?)<\/updated>/
+const ATOM_PUBLISHED_RE = /<published>([\s\S]*?)<\/published>/
+const CDATA_MARKER_RE = /<!\[CDATA\[|\]\]>/g
+const HTML_TAG_RE = /<[^>]*>/g
 
-  for (const feed of REDDIT_FEEDS) {
+async function fetchReddit(): Promise<any[]> {
+  // Feeds are independent — fetch them concurrently rather than one after another
+  const batches = await Promise.all(REDDIT_FEEDS.map(async (feed) => {
+    const items: any[] = []
     try {
-      const controller = new AbortController()
-      const timeoutId = setTimeout(() => controller.abort(), 10000)
-
-      const response = await fetch(feed.url, {
+      const response = await fetchWithRetry(feed.url, {
         headers: { 'User-Agent': 'CAPRI/1.0' },
         cache: 'no-store',
-        signal: controller.signal,
       })
 
-      clearTimeout(timeoutId)
-
       if (!response.ok) {
         console.error(`${feed.name} failed: HTTP ${response.status}`)
-        continue
+        return items
       }
 
       const xml = await response.text()
 
       // Reddit RSS uses Atom format (<entry> not <item>)
-      const entryRegex = /<entry>([\s\S]*?)<\/entry>/gi
+      ATOM_ENTRY_RE.lastIndex = 0
       let match
 
-      while ((match = entryRegex.exec(xml)) !== null) {
+      while ((match = ATOM_ENTRY_RE.exec(xml)) !== null) {
         const entryXml = match[1]
 
         // Title
-        const titleMatch = entryXml.match(/<title>([\s\S]*?)<\/title>/)
+        const titleMatch = entryXml.match(ATOM_TITLE_RE)
         const title = titleMatch
-          ? titleMatch[1].replace(/<!\[CDATA\[|\]\]>/g, '').replace(/<[^>]*>/g, '').trim()
+          ? titleMatch[1].replace(CDATA_MARKER_RE, '').replace(HTML_TAG_RE, '').trim()
           : 'Untitled'
 
         // Link (Atom uses <link href="..."/>)
-        const linkMatch = entryXml.match(/<link\s+href="([^"]*)"/)
+        const linkMatch = entryXml.match(ATOM_LINK_RE)
         const link = linkMatch ? linkMatch[1] : ''
 
         // Content/summary
         const contentMatch =
-          entryXml.match(/<content[^>]*>([\s\S]*?)<\/content>/) ||
-          entryXml.match(/<summary[^>]*>([\s\S]*?)<\/summary>/)
+          entryXml.match(ATOM_CONTENT_RE) ||
+          entryXml.match(ATOM_SUMMARY_RE)
         const rawContent = contentMatch
-          ? contentMatch[1].replace(/<!\[CDATA\[|\]\]>/g, '').replace(/<[^>]*>/g, '').substring(0, 500).trim()
+          ? contentMatch[1].replace(CDATA_MARKER_RE, '').replace(HTML_TAG_RE, '').substring(0, 500).trim()
           : ''
 
         // Date
-        const dateMatch = entryXml.match(/<updated>([\s\S]*?)<\/updated>/) ||
-          entryXml.match(/<published>([\s\S]*?)<\/published>/)
-        const pubDate = dateMatch ? new Date(dateMatch[1]).toISOString() : new Date().toISOString()
+        const dateMatch = entryXml.match(ATOM_UPDATED_RE) ||
+          entryXml.match(ATOM_PUBLISHED_RE)
+        const pubDate = toISODate(dateMatch?.[1])
 
         const fullText = title + ' ' + rawContent
 
@@ -333,9 +329,10 @@ async function fetchReddit(): Promise<any[]> {
     } catch (error) {
       console.error(`${feed.name} error:`, error instanceof Error ? error.message : 'Failed')
     }
-  }
+    return items
+  }))
 
-  return items
+  return batches.flat()
 }
 
 // ── Main export ──
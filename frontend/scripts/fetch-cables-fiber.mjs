@@ -267,7 +267,7 @@ async function fetchSubmarineCables() {
   };
 
   const outputPath = join(DATA_DIR, 'submarine-cables.geojson');
-  writeFileSync(outputPath, JSON.stringify(geojson, null, 2));
+  writeFileSync(outputPath, JSON.stringify(geojson));
   console.log(`\n   Wrote ${features.length} cables to ${outputPath}`);
 
   // Print summary
@@ -656,7 +656,7 @@ function buildFiberRoutes() {
   };
 
   const outputPath = join(DATA_DIR, 'fiber-routes.geojson');
-  writeFileSync(outputPath, JSON.stringify(geojson, null, 2));
+  writeFileSync(outputPath, JSON.stringify(geojson));
   console.log(`   Wrote ${features.length} fiber routes to ${outputPath}`);
 
   // Print carrier summary